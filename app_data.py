@@ -3,16 +3,54 @@ Data helpers for the Sheet Metal Brazing Streamlit app.
 """
 from __future__ import annotations
 
+import hashlib
+import io
+import multiprocessing
+import os
+import pickle
+import re
+import sys
+import tempfile
+import threading
+import types
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
-try:
-    import pdfplumber  # type: ignore
-except Exception:  # pragma: no cover - optional dependency for offline parsing
-    pdfplumber = None
+import numpy as np
+import pyarrow as pa
+import streamlit as st
 
-import requests
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime
+    import sympy as sp
+
+# On-disk cache for parsed PDF content, keyed by the PDF's sha256.
+CACHE_DIR = Path(".cache")
+
+# Bump whenever a change alters what extraction returns (text mode, table
+# strategy, cell formatting, footnote pattern) so older pickles are ignored.
+_EXTRACTION_VERSION = 1
+
+# Lines that look like table notes, e.g. "* Applies to..." or "NOTE 3: ...".
+_FOOTNOTE_RE = re.compile(r"^[ \t]*(?:\*|Note|NOTE).*$", re.MULTILINE)
+
+# Text backend for the footnote scan: "pymupdf" (default; falls back to pdfplumber)
+# or "pypdfium2". Tables always come from PyMuPDF/pdfplumber.
+_PDF_BACKENDS = ("pymupdf", "pypdfium2")
+PDF_BACKEND = os.environ.get("PDF_BACKEND", "pymupdf").lower()
+if PDF_BACKEND not in _PDF_BACKENDS:
+    warnings.warn(
+        f"Unknown PDF_BACKEND {PDF_BACKEND!r}; expected one of {_PDF_BACKENDS}. Using 'pymupdf'."
+    )
+    PDF_BACKEND = "pymupdf"
+
+# MIL-STD tables are ruled, so only look for tables along drawn lines and skip
+# the slower text-alignment heuristics.
+_TABLE_SETTINGS = {"vertical_strategy": "lines", "horizontal_strategy": "lines", "snap_tolerance": 3}
 
 # Document references (external + expected local copies)
 DOC_LINKS: Dict[str, Dict[str, str]] = {
@@ -27,43 +65,273 @@ DOC_LINKS: Dict[str, Dict[str, str]] = {
 }
 
 
-def _extract_pdf_tables(pdf_path: Path, min_rows: int = 2) -> Tuple[List[List[str]], List[str]]:
-    """Extract basic tables and trailing footnotes from a PDF if possible."""
+# PDF backends are imported on first use so pages that never parse a PDF
+# don't pay their import cost.
+@lru_cache(maxsize=None)
+def _import_pymupdf():
+    try:
+        import pymupdf  # type: ignore
+    except Exception:  # pragma: no cover - optional dependency, preferred PDF backend
+        return None
+    return pymupdf
+
+
+@lru_cache(maxsize=None)
+def _import_pdfplumber():
+    try:
+        import pdfplumber  # type: ignore
+    except Exception:  # pragma: no cover - optional dependency for offline parsing
+        return None
+    return pdfplumber
+
 
-    if pdfplumber is None or not pdf_path.exists():
-        return [], []
+@lru_cache(maxsize=None)
+def _import_pypdfium2():
+    try:
+        import pypdfium2  # type: ignore
+    except Exception:  # pragma: no cover - optional dependency for fast text extraction
+        return None
+    return pypdfium2
+
+
+@lru_cache(maxsize=None)
+def _resolved_backends() -> Optional[Tuple[str, str]]:
+    """Return the (table, text) backends that will actually run.
+
+    ``None`` means no table backend is installed.
+    """
+
+    if _import_pymupdf() is not None:
+        table = "pymupdf"
+    elif _import_pdfplumber() is not None:
+        table = "pdfplumber"
+    else:
+        return None
+
+    text = table
+    if PDF_BACKEND == "pypdfium2":
+        if _import_pypdfium2() is not None:
+            text = "pypdfium2"
+        else:
+            warnings.warn(f"PDF_BACKEND='pypdfium2' but pypdfium2 is not installed; using {table}.")
+    return table, text
+
+
+def _open_pdf(source):
+    """Open a PDF path or in-memory buffer with whichever backend is installed."""
+
+    pymupdf = _import_pymupdf()
+    if pymupdf is not None:
+        if isinstance(source, bytes):
+            return pymupdf.open(stream=source, filetype="pdf")
+        return pymupdf.open(str(source))
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    return _import_pdfplumber().open(source)
+
+
+def _page_count(doc) -> int:
+    return doc.page_count if _import_pymupdf() is not None else len(doc.pages)
+
+
+def _parse_loaded_page(
+    doc, page_idx: int, min_rows: int = 2, with_text: bool = True
+) -> Tuple[List[List[str]], List[str]]:
+    """Extract tables and candidate footnotes from one page of an open document.
+
+    ``with_text=False`` skips the footnote text pass when another backend handles it.
+    """
 
     tables: List[List[str]] = []
     footnotes: List[str] = []
+    if _import_pymupdf() is not None:
+        page = doc[page_idx]
+        finder = page.find_tables(strategy="lines", snap_tolerance=_TABLE_SETTINGS["snap_tolerance"])
+        raw_tables = [found.extract() for found in finder.tables]
+        text_lines = (page.get_text("text") or "") if with_text else ""
+    else:
+        page = doc.pages[page_idx]
+        try:
+            raw_tables = page.extract_tables(table_settings=_TABLE_SETTINGS)
+            text_lines = (page.extract_text() or "") if with_text else ""
+        finally:
+            # Drop the cached layout objects; otherwise a long-lived document
+            # handle keeps every parsed page in memory.
+            page.close()
+
+    # Collect tables with at least ``min_rows`` rows.
+    for table in raw_tables:
+        if not table or len(table) < min_rows:
+            continue
+        # Flatten header gaps and strip whitespace.
+        tables.append([" | ".join(cell.strip() if cell else "" for cell in row) for row in table])
+
+    # Collect candidate footnotes at bottom of the page.
+    footnotes.extend(m.group(0).strip() for m in _FOOTNOTE_RE.finditer(text_lines))
+    return tables, footnotes
+
+
+# Document opened once per worker process by ``_init_page_worker``.
+_worker_doc = None
+
+
+def _init_page_worker(pdf_bytes: bytes) -> None:
+    """Open the in-memory PDF once when a worker process starts."""
+
+    global _worker_doc
+    _worker_doc = _open_pdf(pdf_bytes)
+
+
+def _parse_worker_page(
+    page_idx: int, min_rows: int = 2, with_text: bool = True
+) -> Tuple[List[List[str]], List[str]]:
+    """Extract tables and candidate footnotes from one page of the worker's document.
+
+    Kept at module level so it can be shipped to worker processes.
+    """
+
+    return _parse_loaded_page(_worker_doc, page_idx, min_rows, with_text)
+
+
+def _extract_text_pypdfium2(pdf_path: Path) -> List[str]:
+    """Return the text layer of each page using pypdfium2's PDFium bindings."""
+
+    pdfium = _import_pypdfium2()
+    pages: List[str] = []
+    pdf = pdfium.PdfDocument(str(pdf_path))
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                # Collect tables with at least ``min_rows`` rows.
-                for table in page.extract_tables():
-                    if not table or len(table) < min_rows:
-                        continue
-                    # Flatten header gaps and strip whitespace.
-                    cleaned = [[(cell or "").strip() for cell in row] for row in table]
-                    tables.append([" | ".join(row) for row in cleaned])
-
-                # Collect candidate footnotes at bottom of the page.
-                text_lines = page.extract_text(layout=True, x_density=5, y_density=5) or ""
-                for line in text_lines.splitlines():
-                    if line.strip().startswith(("*", "Note", "NOTE")):
-                        footnotes.append(line.strip())
+        for page in pdf:
+            try:
+                textpage = page.get_textpage()
+                try:
+                    pages.append(textpage.get_text_range())
+                finally:
+                    textpage.close()
+            finally:
+                page.close()
+    finally:
+        pdf.close()
+    return pages
+
+
+# The cached handle is shared across sessions and PDF backends are not thread-safe.
+_PDF_HANDLE_LOCK = threading.Lock()
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _open_pdf_document(path: str, digest: str):
+    """Keep one live document handle; ``digest`` rebuilds it when the file changes.
+
+    Only used on single-core deploys, where pages are parsed in-process; elsewhere
+    the process pool opens its own copies. Callers must hold ``_PDF_HANDLE_LOCK``.
+    """
+
+    return _open_pdf(Path(path))
+
+
+def _pool_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+_MAIN_SWAP_LOCK = threading.Lock()
+
+
+@contextmanager
+def _detached_main():
+    """Hide the Streamlit page from spawned workers while the pool is alive.
+
+    Streamlit installs each page script as ``__main__``; spawn/forkserver children
+    would re-run that file on startup. A bare ``__main__`` without ``__file__`` or
+    ``__spec__`` makes them skip the main-module import entirely.
+    """
+
+    with _MAIN_SWAP_LOCK:
+        original = sys.modules.get("__main__")
+        placeholder = types.ModuleType("__main__")
+        sys.modules["__main__"] = placeholder
+        try:
+            yield
+        finally:
+            # Don't clobber a newer __main__ installed by another script run.
+            if sys.modules.get("__main__") is placeholder and original is not None:
+                sys.modules["__main__"] = original
+
+
+def _extract_pdf_tables(
+    pdf_path: Path, min_rows: int = 2, doc=None
+) -> Optional[Tuple[List[List[str]], List[str]]]:
+    """Extract basic tables and trailing footnotes from a PDF if possible.
+
+    Returns ``None`` when the PDF could not be parsed (missing file, no backend,
+    malformed content), so callers can tell a failure from a PDF with no tables.
+
+    PyMuPDF is used when installed; pdfplumber is kept as a fallback backend.
+    Pages are parsed in parallel worker processes and merged in page order.
+    With ``PDF_BACKEND=pypdfium2`` the footnote scan reads pypdfium2 text instead.
+    With only one worker (single core or single page) pages are parsed in-process,
+    from ``doc`` when an already-open handle is passed.
+    """
+
+    backends = _resolved_backends()
+    if backends is None or not pdf_path.exists():
+        return None
+
+    tables: List[List[str]] = []
+    footnotes: List[str] = []
+    try:
+        pdf_bytes = pdf_path.read_bytes() if doc is None else None
+        with ExitStack() as stack:
+            local_doc = doc if doc is not None else stack.enter_context(_open_pdf(pdf_bytes))
+            page_count = _page_count(local_doc)
+            if page_count == 0:
+                return [], []
+
+            text_pages = None
+            if backends[1] == "pypdfium2":
+                text_pages = _extract_text_pypdfium2(pdf_path)
+            with_text = text_pages is None
+
+            workers = min(os.cpu_count() or 1, page_count)
+            if workers == 1:
+                pages = [
+                    _parse_loaded_page(local_doc, idx, min_rows, with_text)
+                    for idx in range(page_count)
+                ]
+            else:
+                if pdf_bytes is None:
+                    pdf_bytes = pdf_path.read_bytes()
+                # The PDF is sent once per worker rather than once per page. Workers are
+                # not forked from the multi-threaded Streamlit server, which can deadlock.
+                with _detached_main(), ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=_pool_context(),
+                    initializer=_init_page_worker,
+                    initargs=(pdf_bytes,),
+                ) as executor:
+                    pages = list(
+                        executor.map(
+                            _parse_worker_page,
+                            range(page_count),
+                            [min_rows] * page_count,
+                            [with_text] * page_count,
+                            chunksize=max(1, page_count // (workers * 4)),
+                        )
+                    )
+
+        for page_tables, page_footnotes in pages:
+            tables.extend(page_tables)
+            footnotes.extend(page_footnotes)
+
+        if text_pages is not None:
+            for text_lines in text_pages:
+                footnotes.extend(m.group(0).strip() for m in _FOOTNOTE_RE.finditer(text_lines))
     except Exception:
         # Gracefully degrade if the PDF is malformed or partially downloaded.
-        return [], []
+        return None
 
     # Remove duplicates while preserving order.
-    seen = set()
-    deduped_footnotes: List[str] = []
-    for note in footnotes:
-        if note not in seen:
-            seen.add(note)
-            deduped_footnotes.append(note)
-
-    return tables, deduped_footnotes
+    return tables, list(dict.fromkeys(footnotes))
 
 
 def load_milstd248_tables() -> Dict[str, List[str]]:
@@ -74,242 +342,349 @@ def load_milstd248_tables() -> Dict[str, List[str]]:
     """
 
     pdf_path = Path(DOC_LINKS["MIL-SD-248D"]["local"])
-    tables, footnotes = _extract_pdf_tables(pdf_path)
-    return {"tables": tables, "footnotes": footnotes}
-
-BASE_FILLER_MATERIALS: List[Dict[str, str]] = [
-    {
-        "Base Material": "Low-carbon steel sheet",
-        "Filler Metals": "AWS A5.18 ER70S-6; AWS A5.20 E71T-1",
-        "Process": "GMAW, FCAW, GTAW",
-        "Guiding Spec": "MIL-SD-248D",
-    },
-    {
-        "Base Material": "Austenitic stainless steel",
-        "Filler Metals": "AWS A5.9 ER308L/ER309L; AWS A5.22 E308LT",
-        "Process": "GTAW, GMAW-P, SMAW",
-        "Guiding Spec": "MIL-SD-248D",
-    },
-    {
-        "Base Material": "Aluminum alloys (5xxx/6xxx)",
-        "Filler Metals": "AWS A5.10 ER4043; AWS A5.10 ER5356",
-        "Process": "GMAW, GTAW",
-        "Guiding Spec": "MIL-S-23284A",
-    },
-    {
-        "Base Material": "Nickel-base alloys",
-        "Filler Metals": "AWS A5.14 ERNiCr-3; BNi-2 brazing alloy",
-        "Process": "GTAW, brazing",
-        "Guiding Spec": "MIL-S-23284A",
-    },
-]
+    if not pdf_path.exists():
+        return {"tables": [], "footnotes": []}
 
-INSPECTION_CHECKLIST: List[Dict[str, str]] = [
-    {
-        "Category": "Joint preparation",
-        "Characteristic": "Edges deburred, fit-up within specified root opening, backing/consumable inserts per WPS",
-        "Why it matters": "Controls penetration and prevents inclusions or lack of fusion",
-    },
-    {
-        "Category": "Cleanliness",
-        "Characteristic": "No oil, oxide, paint, or mill scale; solvent wiped per process instructions",
-        "Why it matters": "Prevents porosity and incomplete fusion, especially critical for GTAW/GMAW on aluminum",
-    },
-    {
-        "Category": "Filler verification",
-        "Characteristic": "Filler classification, diameter, heat/lot match WPS and MIL filler list",
-        "Why it matters": "Ensures mechanical properties and corrosion resistance align with base metal",
-    },
-    {
-        "Category": "Preheat/interpass",
-        "Characteristic": "Measured with contact pyrometer or temp stick; documented within WPS limits",
-        "Why it matters": "Prevents hydrogen cracking and controls distortion",
-    },
-    {
-        "Category": "Shielding gas",
-        "Characteristic": "Type, purity, flow rate per WPS; hoses purged; dew point controlled for aluminum",
-        "Why it matters": "Protects molten pool from contamination and nitrogen/oxygen pickup",
-    },
-    {
-        "Category": "Visual weld quality",
-        "Characteristic": "Bead profile, reinforcement, undercut, arc strikes, overlap within acceptance per MIL-SD-248D",
-        "Why it matters": "Visual cues often correlate with internal quality and dimensional control",
-    },
-    {
-        "Category": "Dimensional/GD&T",
-        "Characteristic": "Flatness, perpendicularity, hole position check against drawing feature control frames",
-        "Why it matters": "Assures assembly interchangeability and fit for bonded/brazed structures",
-    },
-]
+    stat = pdf_path.stat()
+    try:
+        return _load_milstd248_tables_cached(str(pdf_path), stat.st_mtime_ns, stat.st_size)
+    except _ExtractionFailed:
+        return {"tables": [], "footnotes": []}
 
-WELDING_LIMITATIONS: List[Dict[str, str]] = [
-    {
-        "Process": "GTAW",
-        "Forms": "Sheet, tube, light gauge extrusions",
-        "Positions": "All (1G/2G/3G/4G, 1F-4F)",
-        "Limitations": "Use direct current electrode negative for most alloys; AC with balance control for aluminum; backing or purge required on full-penetration joints",
-    },
-    {
-        "Process": "GMAW-P",
-        "Forms": "Sheet and thin plate with spray or pulsed transfer",
-        "Positions": "Flat, horizontal, limited vertical-up",
-        "Limitations": "Preferred for controlled heat input; short-circuit only where allowed by WPS for thin gage and fillets",
-    },
-    {
-        "Process": "FCAW-G",
-        "Forms": "Structural shapes, thicker sheet assemblies",
-        "Positions": "All position with appropriate classification",
-        "Limitations": "Requires external shielding; restrict for thin sheet due to higher heat and spatter",
-    },
-    {
-        "Process": "Brazing (torch/furnace)",
-        "Forms": "Lap joints, hem flanges, honeycomb core skins",
-        "Positions": "Primarily flat/fixtured",
-        "Limitations": "Gap uniformity critical; flux selection and post-cleaning per filler manufacturer and spec",
-    },
-]
 
-MATERIAL_THICKNESS_LIMITS: List[Dict[str, str]] = [
-    {
-        "Process": "GTAW",
-        "Thickness Qualified": "0.020 in to 0.500 in depending on test coupon",
-        "Notes": "Use backing for full-penetration under 0.125 in; pulse recommended for thin aluminum",
-    },
-    {
-        "Process": "GMAW-P",
-        "Thickness Qualified": "0.063 in to 0.750 in",
-        "Notes": "Spray/pulsed transfer for >0.125 in; short-circuit limited to sheet if procedure qualified",
-    },
-    {
-        "Process": "Brazing",
-        "Thickness Qualified": "0.010 in to 0.125 in typical for sheet lap joints",
-        "Notes": "Control joint gap (0.002-0.006 in) and capillary action; thicker sections require soak control",
-    },
-]
+class _ExtractionFailed(Exception):
+    """Raised inside cached loaders so failed parses are retried instead of memoized."""
 
-ASSEMBLY_TESTS: List[Dict[str, str]] = [
-    {
-        "Assembly Test": "Macroetch",
-        "Requirement": "Sectioned sample shows full penetration/filler distribution; fusion to root/backing",
-        "When": "Each procedure qualification and periodic audit per MIL-SD-248D",
-    },
-    {
-        "Assembly Test": "Fillet break/face bend",
-        "Requirement": "No open defects >1/8 in; sound fusion at root",
-        "When": "Performance qualification for fillet positions",
-    },
-    {
-        "Assembly Test": "Proof/pressure test",
-        "Requirement": "Leak-tight to drawing requirement (e.g., 1.5x design pressure)",
-        "When": "Tanks/ducting; procedure demonstration",
-    },
-]
 
-FILLER_COMBINATIONS: List[Dict[str, str]] = [
-    {
-        "Base Metal": "Carbon steel",
-        "Filler": "ER70S-6 / E7018",
-        "Process": "GMAW / SMAW",
-        "Notes": "Suitable for structural sheet; low hydrogen electrodes for restraint",
-    },
-    {
-        "Base Metal": "304/316 stainless",
-        "Filler": "ER308L / ER309L",
-        "Process": "GTAW / GMAW-P",
-        "Notes": "Use ER309L when welding dissimilar or cladding",
-    },
-    {
-        "Base Metal": "6061-T6",
-        "Filler": "ER4043 (general), ER5356 (higher strength)",
-        "Process": "GTAW / GMAW",
-        "Notes": "Avoid ER5356 if service >150°F where stress corrosion risk exists",
-    },
-    {
-        "Base Metal": "Nickel alloys",
-        "Filler": "ERNiCr-3; BNi-2 for brazing",
-        "Process": "GTAW / Brazing",
-        "Notes": "Maintain inert backing; control heat input for precipitate-hardened grades",
-    },
-]
+@st.cache_data(show_spinner=False)
+def _load_milstd248_tables_cached(path: str, mtime_ns: int, size: int) -> Dict[str, List[str]]:
+    """Parse the PDF once per (path, mtime, size) so reruns skip re-extraction."""
 
-QUALIFICATION_LIMITS: List[Dict[str, str]] = [
-    {
-        "Test": "Groove weld procedure",
-        "Limitation": "Qualified thickness range per coupon (e.g., 0.250 in qualifies 0.125-0.500 in); position qualified separately",
-    },
-    {
-        "Test": "Fillet weld performance",
-        "Limitation": "Welder qualified for equal or smaller fillet size and same or easier position",
-    },
-    {
-        "Test": "Brazing procedure",
-        "Limitation": "Qualified base-metal thickness ±50% of test coupon; joint type limited to tested configuration",
-    },
-    {
-        "Test": "Brazing performance",
-        "Limitation": "Operator limited to process, filler, joint type, and base-metal thickness tested",
-    },
-]
+    result = _load_pdf_tables_disk_cached(Path(path))
+    if result is None:
+        raise _ExtractionFailed(path)
+    return result
 
-PERFORMANCE_EVAL: List[Dict[str, str]] = [
-    {
-        "Evaluation": "Visual examination",
-        "Requirement": "No cracks, lack of fusion, excessive reinforcement, or undercut per acceptance criteria",
-    },
-    {
-        "Evaluation": "Bend tests",
-        "Requirement": "Root/face bends with no open defects >1/8 in in tensile surface",
-    },
-    {
-        "Evaluation": "Radiography/UT",
-        "Requirement": "Where specified for critical joints; must meet volumetric acceptance per MIL-SD-248D",
-    },
-]
 
-BRAZING_REQUIREMENTS: List[Dict[str, str]] = [
-    {
-        "Topic": "Base material cleanliness",
-        "Requirement": "Oxide removal and solvent cleaning immediately prior to brazing; avoid chloride residues",
-    },
-    {
-        "Topic": "Brazing alloy",
-        "Requirement": "BNi-2 for nickel alloys; BAlSi-4/BAlSi-1 for aluminum; follow flow/clearance guidance",
-    },
-    {
-        "Topic": "Flux/atmosphere",
-        "Requirement": "Use appropriate flux for torch brazing; vacuum or argon for furnace/inert brazing",
-    },
-    {
-        "Topic": "Post-braze cleaning",
-        "Requirement": "Remove flux residues; inspect for voids and flow completeness via section or NDI",
-    },
-]
+def _digest_path(pdf_path: Path) -> Path:
+    return pdf_path.with_name(pdf_path.name + ".sha256")
 
-BRAZING_QUALIFICATION: List[Dict[str, str]] = [
-    {
-        "Item": "Brazing alloys for PQ",
-        "Requirement": "Use production filler type and thickness range; document heat/lot",
-    },
-    {
-        "Item": "Performance test specimens",
-        "Requirement": "Lap shear coupons sized to joint design; furnace/torch cycle recorded",
-    },
-    {
-        "Item": "Thickness qualified",
-        "Requirement": "Test coupon thickness qualifies 0.5x to 2x of tested thickness for same alloy family",
-    },
-    {
-        "Item": "Axial load / torque",
-        "Requirement": "Demonstrate joint can meet calculated load or torque from design allowables; fixture and record peak values",
-    },
-]
 
-GD_T_CALL_OUTS: List[Dict[str, str]] = [
-    {"Callout": "Flatness (⏤)", "Use": "Control skin panels after brazing to prevent oil-canning"},
-    {"Callout": "Perpendicularity (⌖)", "Use": "Maintain flange-to-web alignment on formed channels"},
-    {"Callout": "Position (⌀)", "Use": "Locate pierced holes for fasteners and brazed inserts"},
-    {"Callout": "Profile of a surface (∩)", "Use": "Capture aerodynamic surface after forming/brazing"},
-]
+def _write_digest(pdf_path: Path, digest: str) -> None:
+    """Record ``digest`` next to the PDF along with the size/mtime it was computed for."""
+
+    stat = pdf_path.stat()
+    _digest_path(pdf_path).write_text(f"{digest} {stat.st_size} {stat.st_mtime_ns}\n")
+
+
+def _pdf_digest(pdf_path: Path) -> str:
+    """Return the PDF's sha256, reusing the digest recorded at download time if current.
+
+    The recorded digest is only trusted when the PDF's size and mtime match exactly.
+    """
+
+    try:
+        digest, size, mtime_ns = _digest_path(pdf_path).read_text().split()
+        stat = pdf_path.stat()
+        if len(digest) == 64 and (int(size), int(mtime_ns)) == (stat.st_size, stat.st_mtime_ns):
+            return digest
+    except (OSError, ValueError):
+        pass
+    return hashlib.sha256(pdf_path.read_bytes()).hexdigest()
+
+
+def _cache_path(digest: str, backends: Tuple[str, str]) -> Path:
+    """Return the pickle location for a PDF's hash, resolved backends and extraction version."""
+
+    table, text = backends
+    return CACHE_DIR / f"{digest}.{table}-{text}.v{_EXTRACTION_VERSION}.pkl"
+
+
+def _load_pdf_tables_disk_cached(pdf_path: Path) -> Optional[Dict[str, List[str]]]:
+    """Load extracted tables from the on-disk cache, parsing the PDF on a miss.
+
+    Returns ``None`` if the PDF could not be parsed.
+    """
+
+    backends = _resolved_backends()
+    if backends is None:
+        return None
+
+    digest = _pdf_digest(pdf_path)
+    cache_path = _cache_path(digest, backends)
+    if cache_path.exists():
+        try:
+            with cache_path.open("rb") as handle:
+                return pickle.load(handle)
+        except Exception:
+            # Fall through and rebuild a corrupt or incompatible cache entry.
+            pass
+
+    doc = None
+    single_core = (os.cpu_count() or 1) == 1
+    if single_core:
+        try:
+            doc = _open_pdf_document(str(pdf_path), digest)
+        except Exception:
+            # Let _extract_pdf_tables open (and fail on) the file itself.
+            doc = None
+    if doc is not None:
+        with _PDF_HANDLE_LOCK:
+            extracted = _extract_pdf_tables(pdf_path, doc=doc)
+    else:
+        extracted = _extract_pdf_tables(pdf_path)
+    if extracted is None:
+        # Don't persist failed parses; a later run may have a working backend.
+        return None
+
+    tables, footnotes = extracted
+    result = {"tables": tables, "footnotes": footnotes}
+
+    tmp_name = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".tmp", delete=False) as tmp:
+            tmp_name = tmp.name
+            pickle.dump(result, tmp)
+        os.replace(tmp_name, cache_path)
+    except (OSError, pickle.PicklingError):
+        # Caching is best-effort; a read-only filesystem should not break the page.
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.remove(tmp_name)
+    return result
+
+BASE_FILLER_MATERIALS: Dict[str, Tuple[str, ...]] = {
+    "Base Material": (
+        "Low-carbon steel sheet",
+        "Austenitic stainless steel",
+        "Aluminum alloys (5xxx/6xxx)",
+        "Nickel-base alloys",
+    ),
+    "Filler Metals": (
+        "AWS A5.18 ER70S-6; AWS A5.20 E71T-1",
+        "AWS A5.9 ER308L/ER309L; AWS A5.22 E308LT",
+        "AWS A5.10 ER4043; AWS A5.10 ER5356",
+        "AWS A5.14 ERNiCr-3; BNi-2 brazing alloy",
+    ),
+    "Process": (
+        "GMAW, FCAW, GTAW",
+        "GTAW, GMAW-P, SMAW",
+        "GMAW, GTAW",
+        "GTAW, brazing",
+    ),
+    "Guiding Spec": (
+        "MIL-SD-248D",
+        "MIL-SD-248D",
+        "MIL-S-23284A",
+        "MIL-S-23284A",
+    ),
+}
+
+INSPECTION_CHECKLIST: Dict[str, Tuple[str, ...]] = {
+    "Category": (
+        "Joint preparation",
+        "Cleanliness",
+        "Filler verification",
+        "Preheat/interpass",
+        "Shielding gas",
+        "Visual weld quality",
+        "Dimensional/GD&T",
+    ),
+    "Characteristic": (
+        "Edges deburred, fit-up within specified root opening, backing/consumable inserts per WPS",
+        "No oil, oxide, paint, or mill scale; solvent wiped per process instructions",
+        "Filler classification, diameter, heat/lot match WPS and MIL filler list",
+        "Measured with contact pyrometer or temp stick; documented within WPS limits",
+        "Type, purity, flow rate per WPS; hoses purged; dew point controlled for aluminum",
+        "Bead profile, reinforcement, undercut, arc strikes, overlap within acceptance per MIL-SD-248D",
+        "Flatness, perpendicularity, hole position check against drawing feature control frames",
+    ),
+    "Why it matters": (
+        "Controls penetration and prevents inclusions or lack of fusion",
+        "Prevents porosity and incomplete fusion, especially critical for GTAW/GMAW on aluminum",
+        "Ensures mechanical properties and corrosion resistance align with base metal",
+        "Prevents hydrogen cracking and controls distortion",
+        "Protects molten pool from contamination and nitrogen/oxygen pickup",
+        "Visual cues often correlate with internal quality and dimensional control",
+        "Assures assembly interchangeability and fit for bonded/brazed structures",
+    ),
+}
+
+WELDING_LIMITATIONS: Dict[str, Tuple[str, ...]] = {
+    "Process": (
+        "GTAW",
+        "GMAW-P",
+        "FCAW-G",
+        "Brazing (torch/furnace)",
+    ),
+    "Forms": (
+        "Sheet, tube, light gauge extrusions",
+        "Sheet and thin plate with spray or pulsed transfer",
+        "Structural shapes, thicker sheet assemblies",
+        "Lap joints, hem flanges, honeycomb core skins",
+    ),
+    "Positions": (
+        "All (1G/2G/3G/4G, 1F-4F)",
+        "Flat, horizontal, limited vertical-up",
+        "All position with appropriate classification",
+        "Primarily flat/fixtured",
+    ),
+    "Limitations": (
+        "Use direct current electrode negative for most alloys; AC with balance control for aluminum; backing or purge required on full-penetration joints",
+        "Preferred for controlled heat input; short-circuit only where allowed by WPS for thin gage and fillets",
+        "Requires external shielding; restrict for thin sheet due to higher heat and spatter",
+        "Gap uniformity critical; flux selection and post-cleaning per filler manufacturer and spec",
+    ),
+}
+
+MATERIAL_THICKNESS_LIMITS: Dict[str, Tuple[str, ...]] = {
+    "Process": (
+        "GTAW",
+        "GMAW-P",
+        "Brazing",
+    ),
+    "Thickness Qualified": (
+        "0.020 in to 0.500 in depending on test coupon",
+        "0.063 in to 0.750 in",
+        "0.010 in to 0.125 in typical for sheet lap joints",
+    ),
+    "Notes": (
+        "Use backing for full-penetration under 0.125 in; pulse recommended for thin aluminum",
+        "Spray/pulsed transfer for >0.125 in; short-circuit limited to sheet if procedure qualified",
+        "Control joint gap (0.002-0.006 in) and capillary action; thicker sections require soak control",
+    ),
+}
+
+ASSEMBLY_TESTS: Dict[str, Tuple[str, ...]] = {
+    "Assembly Test": (
+        "Macroetch",
+        "Fillet break/face bend",
+        "Proof/pressure test",
+    ),
+    "Requirement": (
+        "Sectioned sample shows full penetration/filler distribution; fusion to root/backing",
+        "No open defects >1/8 in; sound fusion at root",
+        "Leak-tight to drawing requirement (e.g., 1.5x design pressure)",
+    ),
+    "When": (
+        "Each procedure qualification and periodic audit per MIL-SD-248D",
+        "Performance qualification for fillet positions",
+        "Tanks/ducting; procedure demonstration",
+    ),
+}
+
+FILLER_COMBINATIONS: Dict[str, Tuple[str, ...]] = {
+    "Base Metal": (
+        "Carbon steel",
+        "304/316 stainless",
+        "6061-T6",
+        "Nickel alloys",
+    ),
+    "Filler": (
+        "ER70S-6 / E7018",
+        "ER308L / ER309L",
+        "ER4043 (general), ER5356 (higher strength)",
+        "ERNiCr-3; BNi-2 for brazing",
+    ),
+    "Process": (
+        "GMAW / SMAW",
+        "GTAW / GMAW-P",
+        "GTAW / GMAW",
+        "GTAW / Brazing",
+    ),
+    "Notes": (
+        "Suitable for structural sheet; low hydrogen electrodes for restraint",
+        "Use ER309L when welding dissimilar or cladding",
+        "Avoid ER5356 if service >150°F where stress corrosion risk exists",
+        "Maintain inert backing; control heat input for precipitate-hardened grades",
+    ),
+}
+
+QUALIFICATION_LIMITS: Dict[str, Tuple[str, ...]] = {
+    "Test": (
+        "Groove weld procedure",
+        "Fillet weld performance",
+        "Brazing procedure",
+        "Brazing performance",
+    ),
+    "Limitation": (
+        "Qualified thickness range per coupon (e.g., 0.250 in qualifies 0.125-0.500 in); position qualified separately",
+        "Welder qualified for equal or smaller fillet size and same or easier position",
+        "Qualified base-metal thickness ±50% of test coupon; joint type limited to tested configuration",
+        "Operator limited to process, filler, joint type, and base-metal thickness tested",
+    ),
+}
+
+PERFORMANCE_EVAL: Dict[str, Tuple[str, ...]] = {
+    "Evaluation": (
+        "Visual examination",
+        "Bend tests",
+        "Radiography/UT",
+    ),
+    "Requirement": (
+        "No cracks, lack of fusion, excessive reinforcement, or undercut per acceptance criteria",
+        "Root/face bends with no open defects >1/8 in in tensile surface",
+        "Where specified for critical joints; must meet volumetric acceptance per MIL-SD-248D",
+    ),
+}
+
+BRAZING_REQUIREMENTS: Dict[str, Tuple[str, ...]] = {
+    "Topic": (
+        "Base material cleanliness",
+        "Brazing alloy",
+        "Flux/atmosphere",
+        "Post-braze cleaning",
+    ),
+    "Requirement": (
+        "Oxide removal and solvent cleaning immediately prior to brazing; avoid chloride residues",
+        "BNi-2 for nickel alloys; BAlSi-4/BAlSi-1 for aluminum; follow flow/clearance guidance",
+        "Use appropriate flux for torch brazing; vacuum or argon for furnace/inert brazing",
+        "Remove flux residues; inspect for voids and flow completeness via section or NDI",
+    ),
+}
+
+BRAZING_QUALIFICATION: Dict[str, Tuple[str, ...]] = {
+    "Item": (
+        "Brazing alloys for PQ",
+        "Performance test specimens",
+        "Thickness qualified",
+        "Axial load / torque",
+    ),
+    "Requirement": (
+        "Use production filler type and thickness range; document heat/lot",
+        "Lap shear coupons sized to joint design; furnace/torch cycle recorded",
+        "Test coupon thickness qualifies 0.5x to 2x of tested thickness for same alloy family",
+        "Demonstrate joint can meet calculated load or torque from design allowables; fixture and record peak values",
+    ),
+}
+
+GD_T_CALL_OUTS: Dict[str, Tuple[str, ...]] = {
+    "Callout": (
+        "Flatness (⏤)",
+        "Perpendicularity (⌖)",
+        "Position (⌀)",
+        "Profile of a surface (∩)",
+    ),
+    "Use": (
+        "Control skin panels after brazing to prevent oil-canning",
+        "Maintain flange-to-web alignment on formed channels",
+        "Locate pierced holes for fasteners and brazed inserts",
+        "Capture aerodynamic surface after forming/brazing",
+    ),
+}
+
+# Arrow tables built once per process so page reruns don't rebuild them
+BASE_FILLER_MATERIALS_TABLE = pa.Table.from_pydict(BASE_FILLER_MATERIALS)
+INSPECTION_CHECKLIST_TABLE = pa.Table.from_pydict(INSPECTION_CHECKLIST)
+WELDING_LIMITATIONS_TABLE = pa.Table.from_pydict(WELDING_LIMITATIONS)
+MATERIAL_THICKNESS_LIMITS_TABLE = pa.Table.from_pydict(MATERIAL_THICKNESS_LIMITS)
+ASSEMBLY_TESTS_TABLE = pa.Table.from_pydict(ASSEMBLY_TESTS)
+FILLER_COMBINATIONS_TABLE = pa.Table.from_pydict(FILLER_COMBINATIONS)
+QUALIFICATION_LIMITS_TABLE = pa.Table.from_pydict(QUALIFICATION_LIMITS)
+PERFORMANCE_EVAL_TABLE = pa.Table.from_pydict(PERFORMANCE_EVAL)
+BRAZING_REQUIREMENTS_TABLE = pa.Table.from_pydict(BRAZING_REQUIREMENTS)
+BRAZING_QUALIFICATION_TABLE = pa.Table.from_pydict(BRAZING_QUALIFICATION)
+GD_T_CALL_OUTS_TABLE = pa.Table.from_pydict(GD_T_CALL_OUTS)
 
 # Engineering equations and their metadata for solver page
 @dataclass
@@ -318,6 +693,91 @@ class EngineeringEquation:
     expression: str
     variables: Dict[str, str]
 
+    # Sympy objects are parsed lazily once per process and reused across reruns.
+    @cached_property
+    def symbols(self) -> Dict[str, sp.Symbol]:
+        import sympy as sp
+
+        return {name: sp.symbols(name) for name in self.variables.keys()}
+
+    @cached_property
+    def expr(self) -> sp.Expr:
+        import sympy as sp
+
+        return sp.sympify(self.expression, locals=self.symbols)
+
+    @cached_property
+    def equation(self) -> sp.Eq:
+        import sympy as sp
+
+        return sp.Eq(self.expr, 0)
+
+    @cached_property
+    def latex(self) -> str:
+        import sympy as sp
+
+        return sp.latex(self.equation)
+
+    @cached_property
+    def variables_table(self) -> pa.Table:
+        return pa.Table.from_pydict(
+            {"Symbol": list(self.variables.keys()), "Meaning": list(self.variables.values())}
+        )
+
+    @cached_property
+    def solutions(self) -> Dict[str, List[Callable[..., complex]]]:
+        """Compiled closed-form roots for every variable, solved once with Sympy.
+
+        Each callable takes the remaining variables in ``variables`` order.
+        """
+        import sympy as sp
+
+        compiled: Dict[str, List[Callable[..., complex]]] = {}
+        for name, symbol in self.symbols.items():
+            args = [s for n, s in self.symbols.items() if n != name]
+            compiled[name] = [
+                sp.lambdify(args, root, "numpy") for root in sp.solve(self.equation, symbol)
+            ]
+        return compiled
+
+    @cached_property
+    def checks(self) -> Tuple[Callable[..., complex], Callable[..., complex]]:
+        """Compiled ``expr`` and its denominator, taking every variable in ``variables`` order."""
+        import sympy as sp
+
+        args = list(self.symbols.values())
+        denominator = sp.denom(sp.together(self.expr))
+        return sp.lambdify(args, self.expr, "numpy"), sp.lambdify(args, denominator, "numpy")
+
+    def solve(self, solve_for: str, inputs: Dict[str, float]) -> List[float]:
+        """Evaluate the precompiled roots for ``solve_for`` and keep finite real values.
+
+        Each root is substituted back into the equation and rejected if it lands on a
+        pole (zero denominator) or does not actually satisfy the numeric inputs.
+        """
+        args = [np.complex128(inputs[name]) for name in self.variables.keys() if name != solve_for]
+        residual, denominator = self.checks
+        results: List[float] = []
+        with np.errstate(all="ignore"):
+            for root in self.solutions[solve_for]:
+                value = np.complex128(root(*args))
+                if not (np.isfinite(value) and np.isreal(value)):
+                    continue
+                point = [
+                    value if name == solve_for else np.complex128(inputs[name])
+                    for name in self.variables.keys()
+                ]
+                den = np.complex128(denominator(*point))
+                res = np.complex128(residual(*point))
+                scale = 1.0 + max(abs(v) for v in point)
+                if den == 0 or not np.isfinite(res) or abs(res) > 1e-9 * scale:
+                    continue
+                # Adding 0.0 normalizes -0.0 to 0.0; repeated roots are reported once.
+                result = float(value.real) + 0.0
+                if result not in results:
+                    results.append(result)
+        return results
+
 
 EQUATIONS: List[EngineeringEquation] = [
     EngineeringEquation(
@@ -374,24 +834,86 @@ def resolved_docs() -> List[Dict[str, str]]:
     return rows
 
 
+@lru_cache(maxsize=None)
+def _current_umask() -> int:
+    """Return the process umask without racing other threads where possible."""
+
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except OSError:
+        pass
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+def _download_one(title: str, links: Dict[str, str]) -> Tuple[str, bool, str]:
+    """Download a single reference PDF if it is missing locally."""
+
+    local_path = Path(links["local"])
+    if local_path.exists():
+        return title, True, "Already present"
+
+    import requests
+
+    tmp_name = None
+    try:
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        with requests.get(links["external"], stream=True, timeout=30) as response:
+            response.raise_for_status()
+            # Stream into a sibling temp file so a partial download never
+            # leaves a truncated PDF at the expected location.
+            with tempfile.NamedTemporaryFile(
+                dir=local_path.parent, suffix=".part", delete=False
+            ) as handle:
+                tmp_name = handle.name
+                # Hash while streaming so the cache key costs no extra read.
+                sha256 = hashlib.sha256()
+                received = 0
+                head = b""
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    handle.write(chunk)
+                    sha256.update(chunk)
+                    received += len(chunk)
+                    if len(head) < 5:
+                        head += chunk[: 5 - len(head)]
+
+            # Reject truncated or non-PDF responses before they replace anything.
+            expected = response.headers.get("Content-Length")
+            if expected is not None and "Content-Encoding" not in response.headers:
+                if int(expected) != received:
+                    raise OSError(f"incomplete download ({received} of {expected} bytes)")
+            if head != b"%PDF-":
+                raise OSError("response is not a PDF")
+        # NamedTemporaryFile creates 0600 files; give the PDF normal permissions.
+        os.chmod(tmp_name, 0o666 & ~_current_umask())
+        os.replace(tmp_name, local_path)
+    except Exception as exc:  # pragma: no cover - network dependent
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        return title, False, f"Download failed: {exc}"
+
+    digest = sha256.hexdigest()
+    try:
+        _write_digest(local_path, digest)
+    except OSError:
+        # The PDF is in place; without the sidecar it is simply rehashed on first parse.
+        pass
+    return title, True, f"Downloaded to {local_path} (sha256 {digest[:12]})"
+
+
 def download_references() -> List[Tuple[str, bool, str]]:
     """Attempt to download missing reference PDFs and return status entries.
 
+    Downloads run concurrently; results are reported in ``DOC_LINKS`` order.
     Each tuple: (document title, success flag, message)
     """
-    results: List[Tuple[str, bool, str]] = []
-    for title, links in DOC_LINKS.items():
-        local_path = Path(links["local"])
-        if local_path.exists():
-            results.append((title, True, "Already present"))
-            continue
-
-        try:
-            response = requests.get(links["external"], timeout=30)
-            response.raise_for_status()
-            local_path.parent.mkdir(parents=True, exist_ok=True)
-            local_path.write_bytes(response.content)
-            results.append((title, True, f"Downloaded to {local_path}"))
-        except Exception as exc:  # pragma: no cover - network dependent
-            results.append((title, False, f"Download failed: {exc}"))
-    return results
+    with ThreadPoolExecutor(max_workers=len(DOC_LINKS)) as executor:
+        by_title = {
+            result[0]: result
+            for result in executor.map(_download_one, DOC_LINKS.keys(), DOC_LINKS.values())
+        }
+    return [by_title[title] for title in DOC_LINKS]
@@ -2,9 +2,9 @@ import pandas as pd
 import streamlit as st
 
 from app_data import (
-    BASE_FILLER_MATERIALS,
+    BASE_FILLER_MATERIALS_TABLE,
     DOC_LINKS,
-    GD_T_CALL_OUTS,
+    GD_T_CALL_OUTS_TABLE,
     download_references,
     load_milstd248_tables,
     resolved_docs,
@@ -21,7 +21,7 @@ st.markdown(
 )
 
 st.subheader("Base and filler materials")
-st.dataframe(pd.DataFrame(BASE_FILLER_MATERIALS), use_container_width=True)
+st.dataframe(BASE_FILLER_MATERIALS_TABLE, use_container_width=True)
 
 st.subheader("MIL-SD-248D extracted tables and footnotes")
 extracted = load_milstd248_tables()
@@ -41,7 +41,7 @@ if extracted["footnotes"]:
         st.write(note)
 
 st.subheader("Drawing callouts to watch")
-st.table(pd.DataFrame(GD_T_CALL_OUTS))
+st.table(GD_T_CALL_OUTS_TABLE)
 
 st.subheader("Document library")
 
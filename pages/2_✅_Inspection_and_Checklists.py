@@ -1,15 +1,14 @@
-import pandas as pd
 import streamlit as st
 
-from app_data import INSPECTION_CHECKLIST, MATERIAL_THICKNESS_LIMITS, WELDING_LIMITATIONS
+from app_data import INSPECTION_CHECKLIST_TABLE, MATERIAL_THICKNESS_LIMITS_TABLE, WELDING_LIMITATIONS_TABLE
 
 st.title("Inspection & Procedure Limits")
 
 st.subheader("Inspection checklist")
-st.dataframe(pd.DataFrame(INSPECTION_CHECKLIST), use_container_width=True)
+st.dataframe(INSPECTION_CHECKLIST_TABLE, use_container_width=True)
 
 st.subheader("Welding procedure limitations")
-st.dataframe(pd.DataFrame(WELDING_LIMITATIONS), use_container_width=True)
+st.dataframe(WELDING_LIMITATIONS_TABLE, use_container_width=True)
 
 st.subheader("Material thickness limits by process")
-st.table(pd.DataFrame(MATERIAL_THICKNESS_LIMITS))
+st.table(MATERIAL_THICKNESS_LIMITS_TABLE)
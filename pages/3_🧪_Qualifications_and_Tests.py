@@ -1,11 +1,10 @@
-import pandas as pd
 import streamlit as st
 
 from app_data import (
-    ASSEMBLY_TESTS,
-    FILLER_COMBINATIONS,
-    PERFORMANCE_EVAL,
-    QUALIFICATION_LIMITS,
+    ASSEMBLY_TESTS_TABLE,
+    FILLER_COMBINATIONS_TABLE,
+    PERFORMANCE_EVAL_TABLE,
+    QUALIFICATION_LIMITS_TABLE,
 )
 
 st.title("Procedure & Performance Qualification")
@@ -15,13 +14,13 @@ st.markdown(
 )
 
 st.subheader("Filler metal and process combinations")
-st.dataframe(pd.DataFrame(FILLER_COMBINATIONS), use_container_width=True)
+st.dataframe(FILLER_COMBINATIONS_TABLE, use_container_width=True)
 
 st.subheader("Qualification test limitations")
-st.table(pd.DataFrame(QUALIFICATION_LIMITS))
+st.table(QUALIFICATION_LIMITS_TABLE)
 
 st.subheader("Performance qualification evaluation")
-st.table(pd.DataFrame(PERFORMANCE_EVAL))
+st.table(PERFORMANCE_EVAL_TABLE)
 
 st.subheader("Welding procedure assembly test requirements")
-st.table(pd.DataFrame(ASSEMBLY_TESTS))
+st.table(ASSEMBLY_TESTS_TABLE)
@@ -1,7 +1,6 @@
-import pandas as pd
 import streamlit as st
 
-from app_data import BRAZING_QUALIFICATION, BRAZING_REQUIREMENTS
+from app_data import BRAZING_QUALIFICATION_TABLE, BRAZING_REQUIREMENTS_TABLE
 
 st.title("Brazing Requirements")
 
@@ -13,7 +12,7 @@ st.markdown(
 )
 
 st.subheader("Material and brazing alloy requirements")
-st.table(pd.DataFrame(BRAZING_REQUIREMENTS))
+st.table(BRAZING_REQUIREMENTS_TABLE)
 
 st.subheader("Brazing alloys, test specimens, and loads")
-st.dataframe(pd.DataFrame(BRAZING_QUALIFICATION), use_container_width=True)
+st.dataframe(BRAZING_QUALIFICATION_TABLE, use_container_width=True)
@@ -1,8 +1,6 @@
 from typing import Dict, Optional
 
-import pandas as pd
 import streamlit as st
-import sympy as sp
 
 from app_data import EngineeringEquation, EQUATIONS
 
@@ -19,27 +17,23 @@ st.markdown(
 
 
 def solve_equation(eq: EngineeringEquation, solve_for: str, inputs: Dict[str, Optional[float]]):
-    symbols = {name: sp.symbols(name) for name in eq.variables.keys()}
-    expression = sp.sympify(eq.expression, locals=symbols)
-    equation = sp.Eq(expression, 0)
+    known = {k: v for k, v in inputs.items() if v is not None and k != solve_for}
 
-    substitutions = {symbols[k]: v for k, v in inputs.items() if v is not None and k != solve_for}
-    target = symbols[solve_for]
-
-    if len(substitutions) + 1 != len(symbols):
+    if len(known) + 1 != len(eq.variables):
         missing = [k for k in eq.variables.keys() if k not in inputs or inputs[k] is None][0]
         raise ValueError(f"Provide all other values before solving (missing: {missing})")
 
-    solved = sp.solve(equation.subs(substitutions), target)
-    real_solutions = [s for s in solved if s.is_real]
-    return real_solutions
+    # Roots are solved symbolically once per equation; only numeric evaluation runs here.
+    return eq.solve(solve_for, known)
 
 
-for eq in EQUATIONS:
+@st.fragment
+def _equation_panel(eq: EngineeringEquation) -> None:
+    # Widget interactions inside the panel rerun only this fragment, not every equation.
     with st.expander(eq.name, expanded=False):
-        st.latex(sp.Eq(sp.sympify(eq.expression), 0))
+        st.latex(eq.latex)
         st.markdown("**Variables**")
-        st.table(pd.DataFrame(list(eq.variables.items()), columns=["Symbol", "Meaning"]))
+        st.table(eq.variables_table)
 
         solve_for = st.selectbox(
             "Select variable to solve for",
@@ -68,3 +62,7 @@ for eq in EQUATIONS:
                     st.success(f"Solutions for {solve_for}: {', '.join(str(s) for s in solutions)}")
             except Exception as exc:  # noqa: BLE001
                 st.error(str(exc))
+
+
+for eq in EQUATIONS:
+    _equation_panel(eq)